@@ -29,6 +29,129 @@ FORMS = {'tornadus': 'tornadus-incarnate',
 from pkmn_data import PokemonData
 from pkmn_tiering import PokemonTiers
 from pkmn_network import PokemonGraph
+from collections import OrderedDict
+import time
+
+
+class TeammateCache:
+    '''
+        A least-recently-used cache of best teammate results with expiry and data versioning.
+
+        Attributes:
+        - max_size (int): Maximum number of results to keep.
+        - ttl (float): Seconds a result stays valid, or None to never expire.
+        - data_version (str): Version of the data the cached results were computed from.
+        - hits (int): Number of lookups answered from the cache.
+        - misses (int): Number of lookups that had to be computed.
+
+        Methods:
+        - __init__(max_size: int=256, ttl: float=3600): Initializes an empty cache.
+        - make_key(pokemon: str=None, typing: str=None, stat: str=None, stat_value: int=None, num_teammates: int=1, ranks_version: str=None) -> tuple: Returns the key for a query normalized by normalize_query and ranked by ranks_version.
+        - check_version(data_version: str=None): Clears the cache if the data version has changed.
+        - get(key: tuple, data_version: str=None) -> tuple[str, list[str]]: Returns a cached result, or None if missing or expired.
+        - put(key: tuple, result: tuple[str, list[str]], data_version: str=None): Stores a result, evicting the least recently used if full.
+        - clear(): Removes all cached results.
+    '''
+    def __init__(self, max_size: int=256, ttl: float=3600) -> None:
+        '''
+            Initializes an empty cache.
+
+            Args:
+            - max_size (int): Maximum number of results to keep.
+            - ttl (float): Seconds a result stays valid, or None to never expire.
+        '''
+        self.max_size = max_size
+        self.ttl = ttl
+        self.data_version = None
+        self.hits = 0
+        self.misses = 0
+        self.results = OrderedDict()  # key to (expiry time, result), oldest first
+
+    @staticmethod
+    def make_key(pokemon: str=None, typing: str=None, stat: str=None, stat_value: int=None, num_teammates: int=1, ranks_version: str=None) -> tuple:
+        '''
+            Returns the key for a query normalized by normalize_query and ranked by ranks_version.
+
+            Args:
+            - pokemon (str): Base Pokemon for which to find teammates.
+            - typing (str): Type to filter Pokemon by.
+            - stat (str): Stat to filter Pokemon by.
+            - stat_value (int): Minimum value for the specified stat.
+            - num_teammates (int): Number of best teammates to display.
+            - ranks_version (str): Fingerprint of the ranks the query is answered from, from get_ranks_version.
+
+            Returns:
+            tuple: A key that is equal for queries that give the same result.
+        '''
+        return (pokemon, typing, stat, stat_value, num_teammates, ranks_version)  # return query as key
+
+    def check_version(self, data_version: str=None) -> None:
+        '''
+            Clears the cache if the data version has changed.
+
+            Args:
+            - data_version (str): Version of the currently loaded data.
+
+            Returns:
+            None
+        '''
+        if data_version != self.data_version:  # new data invalidates all results
+            self.clear()
+            self.data_version = data_version
+
+    def get(self, key: tuple=None, data_version: str=None) -> tuple[str, list[str]]:
+        '''
+            Returns a cached result, or None if missing or expired.
+
+            Args:
+            - key (tuple): A key from make_key.
+            - data_version (str): Version of the currently loaded data.
+
+            Returns:
+            tuple[str, list[str]]: The cached header and teammates, or None.
+        '''
+        self.check_version(data_version)
+        entry = self.results.get(key)
+
+        if entry is None or (entry[0] is not None and entry[0] < time.monotonic()):
+            self.results.pop(key, None)  # drop expired result
+            self.misses += 1
+
+            return None
+
+        self.results.move_to_end(key)  # mark as most recently used
+        self.hits += 1
+
+        return entry[1]  # return cached result
+
+    def put(self, key: tuple=None, result: tuple[str, list[str]]=None, data_version: str=None) -> None:
+        '''
+            Stores a result, evicting the least recently used if full.
+
+            Args:
+            - key (tuple): A key from make_key.
+            - result (tuple[str, list[str]]): The header and teammates to cache.
+            - data_version (str): Version of the data the result was computed from.
+
+            Returns:
+            None
+        '''
+        self.check_version(data_version)
+        expiry = time.monotonic() + self.ttl if self.ttl is not None else None
+        self.results[key] = (expiry, result)
+        self.results.move_to_end(key)
+
+        while len(self.results) > self.max_size:  # evict least recently used
+            self.results.popitem(last=False)
+
+    def clear(self) -> None:
+        '''
+            Removes all cached results.
+
+            Returns:
+            None
+        '''
+        self.results.clear()
 
 
 def to_api_names(names: list[str]=None) -> list[str]:
@@ -64,7 +187,42 @@ def to_api_names(names: list[str]=None) -> list[str]:
     
     return renamed  # return all PKMN in same order but for PKMN API
 
-def find_best_teammate(ranks: dict[str: float]=None, num_teammates: int=1, data: PokemonData=None, pokemon: str=None, typing: str=None, stat: str=None, stat_value: int=None) -> None:
+def get_ranks_version(ranks: dict[str: float]=None) -> str:
+    '''
+        Fingerprint a ranking so cached results from different rankings are kept apart.
+
+        Args:
+        - ranks (dict[str: float]): Dictionary of Pokemon names and their corresponding ranking scores.
+
+        Returns:
+        str: A fingerprint that changes when the ranked Pokemon or their scores change.
+    '''
+    return f'{hash(tuple(ranks.items())):x}'  # return hash of names and scores in order
+
+def normalize_query(pokemon: str=None, typing: str=None, stat: str=None, stat_value: int=None) -> tuple[str, str, str, int]:
+    '''
+        Normalize the filters of a best teammate query so equal queries look the same.
+
+        Args:
+        - pokemon (str): Base Pokemon for which to find teammates.
+        - typing (str): Type to filter Pokemon by.
+        - stat (str): Stat to filter Pokemon by.
+        - stat_value (int): Minimum value for the specified stat.
+
+        Returns:
+        tuple[str, str, str, int]: The lower-cased and stripped pokemon, typing, stat and the stat value.
+    '''
+    pokemon = pokemon.lower().strip() if pokemon else None
+    typing = typing.lower().strip() if typing else None
+
+    if stat and stat_value:  # stat filter is only applied with both
+        stat = stat.lower().strip()
+    else:
+        stat, stat_value = None, None
+
+    return pokemon, typing, stat, stat_value  # return normalized filters
+
+def find_best_teammate(ranks: dict[str: float]=None, num_teammates: int=1, data: PokemonData=None, pokemon: str=None, typing: str=None, stat: str=None, stat_value: int=None, cache: TeammateCache=None, ranks_version: str=None) -> None:
     '''
         Find the best teammate(s) based on PageRank scores, with optional filtering by type and/or stats.
 
@@ -76,10 +234,49 @@ def find_best_teammate(ranks: dict[str: float]=None, num_teammates: int=1, data:
         - typing (str): Type to filter Pokemon by.
         - stat (str): Stat to filter Pokemon by.
         - stat_value (int): Minimum value for the specified stat.
+        - cache (TeammateCache): Cache of previous results, cleared when data has a new data_version.
+        - ranks_version (str): Fingerprint of ranks from get_ranks_version; computed here if a cache is given without one.
 
         Returns:
         None
     '''
+    pokemon, typing, stat, stat_value = normalize_query(pokemon, typing, stat, stat_value)
+    result = None
+
+    if cache is not None:  # answer hot queries from the cache
+        if ranks_version is None:  # prefer a fingerprint computed once with the ranks
+            ranks_version = get_ranks_version(ranks)
+
+        key = cache.make_key(pokemon, typing, stat, stat_value, num_teammates, ranks_version)
+        data_version = data.data_version if data else None
+        result = cache.get(key, data_version)
+
+    if result is None:
+        result = get_best_teammates(ranks, num_teammates, data, pokemon, typing, stat, stat_value)
+
+        if cache is not None:
+            cache.put(key, result, data_version)
+
+    header, teammates = result
+    print(header)
+    print(*teammates, sep='\n')
+
+def get_best_teammates(ranks: dict[str: float]=None, num_teammates: int=1, data: PokemonData=None, pokemon: str=None, typing: str=None, stat: str=None, stat_value: int=None) -> tuple[str, list[str]]:
+    '''
+        Get the best teammate(s) based on PageRank scores, with optional filtering by type and/or stats.
+
+        Args:
+        - ranks (dict[str: float]): Dictionary of Pokemon names and their corresponding PageRank scores.
+        - num_teammates (int): Number of best teammates to get.
+        - data (PokemonData): Instance of PokemonData class for accessing Pokemon data.
+        - pokemon (str): Base Pokemon for which to find teammates.
+        - typing (str): Type to filter Pokemon by.
+        - stat (str): Stat to filter Pokemon by.
+        - stat_value (int): Minimum value for the specified stat.
+
+        Returns:
+        tuple[str, list[str]]: A header to display and the best teammate(s).
+    '''
     ranked = list(ranks.keys())  # get ranked by PageRank PKMN
     api_named_ranked = []
 
@@ -99,18 +296,16 @@ def find_best_teammate(ranks: dict[str: float]=None, num_teammates: int=1, data:
         else:
             ranked = [p for i, p in enumerate(ranked) if data.get_base_stat(api_named_ranked[i], stat) >= stat_value]
 
-    if not pokemon:  # show best general teammates if no base PKMN provided
-        print('The best teammate(s) are:')
-        print(*ranked[:num_teammates], sep='\n')
-    
-    if pokemon:  # show provided PKMN's best teammate PKMN
+    if pokemon:  # get provided PKMN's best teammate PKMN
         try:
             t = [p for p in ranked if p in data.get_teammates(pokemon)][:num_teammates]
-            print(f'The best teammate(s) for {pokemon} are:')
-            print(*t, sep='\n')
+
+            return f'The best teammate(s) for {pokemon} are:', t
         except KeyError:
-            print('The best teammate(s) are:')
-            print(*ranked[:num_teammates], sep='\n')
+            pass
+
+    # get best general teammates if no (known) base PKMN provided
+    return 'The best teammate(s) are:', ranked[:num_teammates]
 
 if __name__ == '__main__':
     all_data = PokemonData(BASE_URL+TEST_MONTH_URL+TEST_FORMAT_URL)
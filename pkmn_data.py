@@ -14,6 +14,7 @@ STAT_TO_INDEX = {'hp': 0,
 
 import pokebase as pb
 import requests
+import hashlib
 from numpy import ndarray
 import numpy as np
 
@@ -26,7 +27,9 @@ class PokemonData:
         ps_url (str): The URL to the Smogon Showdown JSON data.
 
         Attributes:
+        ps_url (str): The URL the data was loaded from.
         ps_data (dict): The parsed JSON data retrieved from the Smogon Showdown API.
+        data_version (str): A stamp of the month/format and a hash of the loaded data.
 
         Methods:
         - get_all_pokemon(): Returns a list of all Pokemon in the JSON data.
@@ -37,6 +40,7 @@ class PokemonData:
         - get_gxe_stats(pokemon: str): Returns the GXE (Global Usage Expectancy) stats of a given Pokemon.
         - get_tiering_data(): Returns a NumPy array containing Pokemon names and their corresponding GXE stats.
         - get_team_data(): Returns a dictionary containing Pokemon names as keys and their known teammates as values.
+        - get_data_version(content: bytes): Returns a stamp of the month/format and a hash of the loaded data.
     '''
     def __init__(self, ps_url: str=None) -> None:
         '''
@@ -45,7 +49,10 @@ class PokemonData:
             Args:
             ps_url (str): The URL to the Smogon Showdown JSON data.
         '''
-        self.ps_data = requests.get(ps_url).json()
+        self.ps_url = ps_url
+        response = requests.get(ps_url)
+        self.ps_data = response.json()
+        self.data_version = self.get_data_version(response.content)  # hash the downloaded bytes as-is
     
     def get_all_pokemon(self) -> list[str]:
         '''
@@ -150,6 +157,21 @@ class PokemonData:
         
         return teammate_data  # return all data needed for graph
 
+    def get_data_version(self, content: bytes=None) -> str:
+        '''
+            Returns a stamp of the month/format and a hash of the loaded data.
+
+            Args:
+            content (bytes): The raw JSON data as downloaded.
+
+            Returns:
+            str: The month/format of the URL and a SHA-1 of the JSON data, e.g., '2023-11/chaos/gen9vgc2023regulationebo3-1760.json@3f2a...'.
+        '''
+        month_format = self.ps_url.split('/stats/')[-1] if self.ps_url else ''
+        data_hash = hashlib.sha1(content).hexdigest()
+
+        return f'{month_format}@{data_hash}'  # return stamp that changes with new data
+
 
 if __name__ == '__main__':
     # # RUN TESTS ON GETTING THE DATA
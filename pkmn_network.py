@@ -13,13 +13,129 @@ STAT_TO_INDEX = {'hp': 0,
 
 
 import networkx as nx
+from numpy import ndarray
+import numpy as np
+from scipy.sparse import csr_array, diags_array
 from pkmn_data import PokemonData
+from pkmn_rendering import GRAPH_PLOT_FILE
 from pkmn_tiering import PokemonTiers
 from pyvis.network import Network
 import json
+import time
 import webbrowser
 
 
+def pagerank_scores(adjacency: csr_array=None, adjacency_t: csr_array=None, alpha: float=0.85, max_iter: int=100, tol: float=1.0e-6) -> ndarray:
+    '''
+        Computes weighted PageRank scores by power iteration, matching nx.pagerank.
+
+        Args:
+        - adjacency (csr_array): Weighted adjacency where row i to column j is an edge from i to j.
+        - adjacency_t (csr_array): The transpose of adjacency.
+        - alpha (float): Damping factor.
+        - max_iter (int): Maximum number of power iterations.
+        - tol (float): Convergence tolerance per node.
+
+        Returns:
+        ndarray: PageRank score of each node, summing to 1.
+    '''
+    n = adjacency.shape[0]
+    out_weight = np.asarray(adjacency.sum(axis=1)).ravel()
+    dangling = (out_weight == 0)  # nodes with no out-edges spread evenly
+    inv_out_weight = np.divide(1.0, out_weight, out=np.zeros(n), where=~dangling)
+    transition_t = adjacency_t @ diags_array(inv_out_weight)  # column-stochastic
+    x = np.full(n, 1.0 / n)
+
+    for _ in range(max_iter):  # iterate until scores settle
+        x_last = x
+        x = alpha * (transition_t @ x_last + x_last[dangling].sum() / n) + (1.0 - alpha) / n
+
+        if np.abs(x - x_last).sum() < n * tol:
+            break
+
+    return x  # return scores in node order
+
+def hits_scores(adjacency: csr_array=None, adjacency_t: csr_array=None, max_iter: int=100, tol: float=1.0e-8) -> tuple[ndarray, ndarray]:
+    '''
+        Computes weighted HITS hub and authority scores by power iteration.
+
+        Args:
+        - adjacency (csr_array): Weighted adjacency where row i to column j is an edge from i to j.
+        - adjacency_t (csr_array): The transpose of adjacency.
+        - max_iter (int): Maximum number of power iterations.
+        - tol (float): Convergence tolerance per node.
+
+        Returns:
+        tuple[ndarray, ndarray]: Hub and authority scores of each node, each summing to 1.
+    '''
+    n = adjacency.shape[0]
+    hubs = np.full(n, 1.0 / n)
+
+    for _ in range(max_iter):  # hubs point to good authorities and vice versa
+        hubs_last = hubs
+        authorities = adjacency_t @ hubs_last
+        hubs = adjacency @ authorities
+        hubs = hubs / (hubs.max() or 1.0)
+
+        if np.abs(hubs - hubs_last).sum() < n * tol:
+            break
+
+    authorities = adjacency_t @ hubs
+
+    return hubs / (hubs.sum() or 1.0), authorities / (authorities.sum() or 1.0)  # return normalized hubs and authorities
+
+def eigenvector_scores(adjacency: csr_array=None, adjacency_t: csr_array=None, max_iter: int=100, tol: float=1.0e-6) -> ndarray:
+    '''
+        Computes weighted eigenvector centrality over in-edges, matching nx.eigenvector_centrality.
+
+        Args:
+        - adjacency (csr_array): Weighted adjacency where row i to column j is an edge from i to j.
+        - adjacency_t (csr_array): The transpose of adjacency.
+        - max_iter (int): Maximum number of power iterations.
+        - tol (float): Convergence tolerance per node.
+
+        Returns:
+        ndarray: Eigenvector centrality of each node, with unit Euclidean norm.
+    '''
+    n = adjacency.shape[0]
+    x = np.full(n, 1.0 / n)
+
+    for _ in range(max_iter):  # shifted iteration (I + A^T) avoids oscillation
+        x_last = x
+        x = x_last + adjacency_t @ x_last
+        x = x / (np.linalg.norm(x) or 1.0)
+
+        if np.abs(x - x_last).sum() < n * tol:
+            break
+
+    return x  # return scores in node order
+
+def in_degree_scores(adjacency: csr_array=None, adjacency_t: csr_array=None) -> ndarray:
+    '''
+        Computes weighted in-degree of each node.
+
+        Args:
+        - adjacency (csr_array): Weighted adjacency where row i to column j is an edge from i to j.
+        - adjacency_t (csr_array): The transpose of adjacency.
+
+        Returns:
+        ndarray: Sum of incoming edge weights of each node.
+    '''
+    return np.asarray(adjacency_t.sum(axis=1)).ravel()  # return weighted in-degree in node order
+
+
+RANKING_ALGORITHMS = {'pagerank': pagerank_scores,
+                      'hits': hits_scores,
+                      'eigenvector': eigenvector_scores,
+                      'in_degree': in_degree_scores}
+HITS_RANKINGS = ('hits_hubs', 'hits_authorities')
+RANKINGS = {'pagerank': 'pagerank',  # public ranking name to algorithm
+            'hits_hubs': 'hits',
+            'hits_authorities': 'hits',
+            'eigenvector': 'eigenvector',
+            'in_degree': 'in_degree'}
+
+
 class PokemonGraph:
     '''
         A class for creating a network graph of Pokemon where edges indicate teammates.
@@ -31,7 +147,9 @@ class PokemonGraph:
         - __init__(): Initializes an empty directed graph.
         - build_graph(edges: dict[str: list[str]], tiers: dict[str: int]): Builds the graph using a dictionary of Pokemon edges and their tiers.
         - get_pagerank(graph: nx.DiGraph=None) -> dict[str: float]: Computes and returns the PageRank scores of the graph.
-        - viz_graph(graph: nx.DiGraph=None): Visualizes the graph using the pyvis library and saves it as an HTML file.
+        - get_adjacency(graph: nx.DiGraph=None) -> tuple[list[str], csr_array]: Returns the node names and weighted sparse adjacency of the graph.
+        - get_rankings(graph: nx.DiGraph=None, algorithms: list[str]=None, blend: dict[str: float]=None) -> tuple[dict[str: dict[str: float]], dict[str: float]]: Computes several centralities from one shared sparse adjacency, with optional blending and timings.
+        - viz_graph(graph: nx.DiGraph=None, file_path: str=GRAPH_PLOT_FILE, open_browser: bool=True): Visualizes the graph using the pyvis library and saves it as an HTML file.
     '''
     def __init__(self) -> None:
         '''
@@ -74,14 +192,98 @@ class PokemonGraph:
         sorted_scores = dict(sorted(scores.items(), key=lambda score: score[1], reverse=True))
         
         return sorted_scores  # return highest to lowest scores
+
+    @staticmethod
+    def get_adjacency(graph: nx.DiGraph=None) -> tuple[list[str], csr_array]:
+        '''
+            Returns the node names and weighted sparse adjacency of the graph.
+
+            Args:
+            - graph (nx.DiGraph): The directed graph.
+
+            Returns:
+            tuple[list[str], csr_array]: Node names and a CSR adjacency whose row and column order matches them.
+        '''
+        nodes = list(graph.graph.nodes)
+        adjacency = csr_array(nx.to_scipy_sparse_array(graph.graph, nodelist=nodes, weight='weight', dtype=float))
+
+        return nodes, adjacency  # return names and matrix in the same order
+
+    @staticmethod
+    def get_rankings(graph: nx.DiGraph=None, algorithms: list[str]=None, blend: dict[str: float]=None) -> tuple[dict[str: dict[str: float]], dict[str: float]]:
+        '''
+            Computes several centralities from one shared sparse adjacency, with optional blending and timings.
+
+            Args:
+            - graph (nx.DiGraph): The directed graph.
+            - algorithms (list[str]): Rankings to compute, from 'pagerank', 'hits_hubs', 'hits_authorities', 'eigenvector' and 'in_degree' (all if None).
+            - blend (dict[str: float]): Weights per ranking to combine into a 'blend' ranking; each ranking is scaled to sum to 1 first.
+
+            Returns:
+            tuple[dict[str: dict[str: float]], dict[str: float]]: Highest to lowest scores per ranking, and seconds spent per step.
+        '''
+        if algorithms is None:
+            algorithms = list(RANKINGS.keys())
+
+        if blend:  # blended rankings must be computed too
+            algorithms = list(dict.fromkeys([*algorithms, *blend.keys()]))
+
+        for name in algorithms:  # only accept documented ranking names
+            if name not in RANKINGS:
+                raise ValueError(f'Unknown ranking algorithm: {name}')
+
+        timings = {}
+        start = time.perf_counter()
+        nodes, adjacency = PokemonGraph.get_adjacency(graph)
+        adjacency_t = adjacency.T.tocsr()  # shared by every algorithm
+        timings['adjacency'] = time.perf_counter() - start
+
+        raw_scores = {}
+
+        for name in algorithms:  # run each algorithm once on the shared matrices
+            key = RANKINGS[name]
+
+            if name in raw_scores or len(nodes) == 0:
+                continue
+
+            start = time.perf_counter()
+            scores = RANKING_ALGORITHMS[key](adjacency, adjacency_t)
+            timings[key] = time.perf_counter() - start
+
+            if key == 'hits':  # one pass yields both hubs and authorities
+                raw_scores.update(zip(HITS_RANKINGS, scores))
+            else:
+                raw_scores[name] = scores
+
+        if blend and len(nodes) > 0:  # combine rankings on a common scale
+            start = time.perf_counter()
+            blended = np.zeros(len(nodes))
+
+            for name, weight in blend.items():
+                scores = raw_scores[name]
+                blended += weight * scores / (scores.sum() or 1.0)
+
+            raw_scores['blend'] = blended
+            algorithms = [*algorithms, 'blend']
+            timings['blend'] = time.perf_counter() - start
+
+        rankings = {}
+
+        for name in algorithms:  # sort each ranking like get_pagerank
+            scores = dict(zip(nodes, raw_scores[name].tolist())) if nodes else {}
+            rankings[name] = dict(sorted(scores.items(), key=lambda score: score[1], reverse=True))
+
+        return rankings, timings  # return rankings highest to lowest and timings
     
     @staticmethod
-    def viz_graph(graph: nx.DiGraph=None) -> None:
+    def viz_graph(graph: nx.DiGraph=None, file_path: str=GRAPH_PLOT_FILE, open_browser: bool=True) -> None:
         '''
             Visualizes the graph using the pyvis library and saves it as an HTML file.
 
             Args:
             - graph (nx.DiGraph): The directed graph.
+            - file_path (str): The HTML file to save the graph to.
+            - open_browser (bool): If True, opens the HTML file in a browser once saved.
 
             Returns:
             None
@@ -107,8 +309,10 @@ class PokemonGraph:
         net_options_str = json.dumps(net_options)  # as a proper JSON
 
         net.set_options(net_options_str)  # set and save
-        net.write_html('graph.html')
-        webbrowser.open('graph.html')  # this doesn't work for some reason
+        net.write_html(file_path)
+
+        if open_browser:
+            webbrowser.open(file_path)  # this doesn't work for some reason
 
 
 if __name__ == '__main__':
@@ -125,5 +329,10 @@ if __name__ == '__main__':
     pr = graph.get_pagerank(graph)
     print(pr)
 
+    rankings, timings = graph.get_rankings(graph, blend={'pagerank': 0.5, 'hits_authorities': 0.25, 'in_degree': 0.25})
+
+    for name, seconds in timings.items():  # compare ranking costs
+        print(f'{name}: {seconds:.4f}s')
+
     graph.viz_graph(graph)
 
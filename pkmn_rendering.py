@@ -0,0 +1,144 @@
+'''
+Render plots to files in the background so the query flow is not blocked
+'''
+TIERS_PLOT_FILE = 'tiers.png'
+GRAPH_PLOT_FILE = 'graph.html'
+
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+import threading
+import time
+
+
+class PlotRenderer:
+    '''
+        A class for rendering plot artifacts (PNG/HTML files) in a background worker.
+
+        Attributes:
+        - executor (ThreadPoolExecutor): Single worker that renders artifacts one at a time.
+        - timings (dict[str: list[dict[str: float]]]): Seconds spent per submission of each artifact, blocking the caller ('submit') and in the worker ('render', None until rendered).
+
+        Methods:
+        - __init__(notify: bool=True): Initializes the background worker.
+        - submit(name: str, file_path: str, render: Callable, *args, **kwargs) -> Future: Queues an artifact to be rendered to a file.
+        - get_timing_report() -> dict[str: dict[str: float]]: Returns submit, render and saved seconds per artifact, summed over submissions.
+        - print_timing_report(): Prints the timing report.
+        - shutdown(wait: bool=True): Stops the worker, optionally waiting for queued artifacts.
+    '''
+    def __init__(self, notify: bool=True) -> None:
+        '''
+            Initializes the background worker.
+
+            Args:
+            - notify (bool): If True, prints a notice once each artifact is ready.
+        '''
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='plot-renderer')
+        self.notify = notify
+        self.timings = {}
+        self.lock = threading.Lock()  # timings are written from both threads
+
+    def submit(self, name: str=None, file_path: str=None, render: Callable=None, *args, **kwargs) -> Future:
+        '''
+            Queues an artifact to be rendered to a file.
+
+            Args:
+            - name (str): Name of the artifact in notices and the timing report.
+            - file_path (str): File the artifact is written to.
+            - render (Callable): Function called as render(*args, file_path=file_path, **kwargs) in the worker.
+
+            Returns:
+            Future: Completes with file_path once the artifact is written.
+        '''
+        timing = {'submit': 0.0, 'render': None}  # one entry per submission
+
+        with self.lock:
+            self.timings.setdefault(name, []).append(timing)
+
+        start = time.perf_counter()
+        future = self.executor.submit(self.run, name, file_path, render, timing, *args, **kwargs)
+
+        with self.lock:
+            timing['submit'] = time.perf_counter() - start
+
+        return future  # return handle to wait on if needed
+
+    def run(self, name: str=None, file_path: str=None, render: Callable=None, timing: dict[str: float]=None, *args, **kwargs) -> str:
+        '''
+            Renders an artifact in the worker and records how long it took.
+
+            Args:
+            - name (str): Name of the artifact.
+            - file_path (str): File the artifact is written to.
+            - render (Callable): Function that writes the artifact.
+            - timing (dict[str: float]): The timings entry of this submission.
+
+            Returns:
+            str: The file the artifact was written to.
+        '''
+        start = time.perf_counter()
+
+        try:
+            render(*args, file_path=file_path, **kwargs)
+        except Exception as e:  # report failures without crashing the query flow
+            if self.notify:
+                print(f'\nERROR: Could not render {name} plot: {e}')
+
+            raise
+
+        with self.lock:
+            timing['render'] = time.perf_counter() - start
+
+        if self.notify:
+            print(f'\n({name} plot ready: {file_path})')
+
+        return file_path  # return where the artifact is
+
+    def get_timing_report(self) -> dict[str: dict[str: float]]:
+        '''
+            Returns submit, render and saved seconds per artifact, summed over submissions.
+
+            Returns:
+            dict[str: dict[str: float]]: Per artifact, the number of submissions ('runs') and of failed renders ('failed'), seconds the caller blocked ('submit'), seconds rendering ('render') and latency saved ('saved').
+        '''
+        report = {}
+
+        with self.lock:
+            for name, timings in self.timings.items():
+                totals = {'runs': len(timings), 'failed': 0, 'submit': 0.0, 'render': 0.0, 'saved': 0.0}
+
+                for timing in timings:  # saved is render time off the critical path
+                    totals['submit'] += timing['submit']
+
+                    if timing['render'] is None:  # failed or still rendering
+                        totals['failed'] += 1
+                        continue
+
+                    totals['render'] += timing['render']
+                    totals['saved'] += max(timing['render'] - timing['submit'], 0.0)
+
+                report[name] = totals
+
+        return report  # return timings per artifact
+
+    def print_timing_report(self) -> None:
+        '''
+            Prints the timing report.
+
+            Returns:
+            None
+        '''
+        for name, timing in self.get_timing_report().items():
+            print(f"{name}: {timing['runs']} run(s), {timing['failed']} not rendered, rendered in {timing['render']:.2f}s, blocked for {timing['submit']:.4f}s, saved {timing['saved']:.2f}s")
+
+    def shutdown(self, wait: bool=True) -> None:
+        '''
+            Stops the worker, optionally waiting for queued artifacts.
+
+            Args:
+            - wait (bool): If True, waits for queued artifacts to finish rendering.
+
+            Returns:
+            None
+        '''
+        self.executor.shutdown(wait=wait, cancel_futures=not wait)
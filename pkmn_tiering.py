@@ -17,8 +17,11 @@ STAT_TO_INDEX = {'hp': 0,
 from numpy import ndarray
 import numpy as np
 from pkmn_data import PokemonData
-from sklearn.cluster import KMeans
+from pkmn_rendering import PlotRenderer, TIERS_PLOT_FILE
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.metrics import silhouette_score
+import matplotlib
+from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 
 
@@ -28,24 +31,57 @@ class PokemonTiers:
 
         Attributes:
         - gxe_data (ndarray): NumPy array containing Pokemon names and their corresponding GXE scores.
+        - mini_batch (bool): Whether tiers are fit incrementally with MiniBatchKMeans instead of KMeans.
+        - batch_size (int): Number of Pokemon per mini-batch when mini_batch is True.
         - num_tiers (int): The optimal number of tiers determined by the KMeans clustering algorithm.
-        - model (KMeans): The KMeans clustering model.
+        - model (KMeans | MiniBatchKMeans): The clustering model.
+        - tier_centroids (ndarray): Centroids ordered from tier 1 to tier N, set after get_tiers.
+        - tier_changes (int): Number of Pokemon whose tier changed from previous_tiers, set after get_tiers.
 
         Methods:
-        - __init__(gxe_data: ndarray=None): Initializes the PokemonTiers class with GXE data and sets up the clustering model.
+        - __init__(gxe_data: ndarray=None, mini_batch: bool=False, init_centroids: ndarray=None, batch_size: int=1024, max_iter: int=100, tol: float=1.0e-4): Initializes the PokemonTiers class with GXE data and sets up the clustering model.
         - get_num_tiers() -> int: Determines the optimal number of tiers using the silhouette score.
-        - get_tiers(plotting: bool=False) -> dict[str: int]: Assigns Pokemon to tiers and optionally plots the results.
+        - fit_mini_batch(X: ndarray) -> ndarray: Fits the MiniBatchKMeans model over shuffled batches until the centroids settle and labels every Pokemon.
+        - get_tiers(plotting: bool=False, previous_tiers: dict[str: int]=None, renderer: PlotRenderer=None) -> dict[str: int]: Assigns Pokemon to tiers and optionally plots the results.
+        - plot_tiers(X_pokemon_gxe: ndarray, model_labels: ndarray, sorted_tiers: list[int], centroids: ndarray, file_path: str=None): Plots the Pokemon tiers with their centroids, either shown or saved to a file.
     '''
-    def __init__(self, gxe_data: ndarray=None) -> None:
+    def __init__(self, gxe_data: ndarray=None, mini_batch: bool=False, init_centroids: ndarray=None, batch_size: int=1024, max_iter: int=100, tol: float=1.0e-4) -> None:
         '''
             Initializes the PokemonTiers class with GXE data and sets up the clustering model.
 
             Args:
             - gxe_data (ndarray): NumPy array containing Pokemon names and their corresponding GXE scores.
+            - mini_batch (bool): If True, fits tiers incrementally with MiniBatchKMeans.
+            - init_centroids (ndarray): Tier centroids from a previous run (e.g., last month's tier_centroids) to warm-start from.
+            - batch_size (int): Number of Pokemon per mini-batch when mini_batch is True.
+            - max_iter (int): Maximum number of passes over the data when mini_batch is True.
+            - tol (float): Largest centroid move (in GXE) between passes at which mini-batch fitting stops.
         '''
         self.gxe_data = gxe_data
-        self.num_tiers = self.get_num_tiers()
-        self.model = KMeans(self.num_tiers, n_init='auto')
+        self.mini_batch = mini_batch
+        self.batch_size = batch_size
+        self.max_iter = max_iter
+        self.tol = tol
+        self.tier_centroids = None
+        self.tier_changes = None
+
+        if init_centroids is not None:  # warm start keeps previous number of tiers
+            init_centroids = np.asarray(init_centroids, dtype=float)
+            self.num_tiers = len(init_centroids)
+        else:
+            self.num_tiers = self.get_num_tiers()
+
+        if mini_batch and min(batch_size, len(gxe_data)) < self.num_tiers:  # first batch must seed every tier
+            raise ValueError(f'Mini-batches of {min(batch_size, len(gxe_data))} Pokemon are too small for {self.num_tiers} tiers')
+
+        init = init_centroids if init_centroids is not None else 'k-means++'
+
+        if mini_batch:
+            # random reassignment could move a small warm-started tier's centroid away
+            reassignment_ratio = 0.0 if init_centroids is not None else 0.01
+            self.model = MiniBatchKMeans(self.num_tiers, init=init, batch_size=batch_size, n_init='auto', reassignment_ratio=reassignment_ratio)
+        else:
+            self.model = KMeans(self.num_tiers, init=init, n_init='auto')
 
     def get_num_tiers(self) -> int:
         '''
@@ -57,11 +93,16 @@ class PokemonTiers:
         X = self.gxe_data[:, 1:].astype(float)  # e.g., 65, 73, 81 per row
         best_score = -1  # set best score and optimal tiers to -1
         optimal_num_tiers = 1
+        # silhouette is quadratic in memory so sample it for mini-batch runs
+        sample_size = min(len(X), self.batch_size) if self.mini_batch else None
 
         for n_clusters in range(2, 10):  # test different number of tiers
-            model = KMeans(n_clusters, max_iter=50, n_init='auto')
+            if self.mini_batch:
+                model = MiniBatchKMeans(n_clusters, max_iter=50, batch_size=self.batch_size, n_init='auto')
+            else:
+                model = KMeans(n_clusters, max_iter=50, n_init='auto')
             labels = model.fit_predict(X)  # with silhouette metric
-            score = silhouette_score(X, labels)
+            score = silhouette_score(X, labels, sample_size=sample_size)
 
             if n_clusters == 2:  # must be significantly better
                 threshold = 2  # to pick 2 over 3
@@ -75,12 +116,47 @@ class PokemonTiers:
         
         return optimal_num_tiers  # return the number of tiers to be used
 
-    def get_tiers(self, plotting: bool=False) -> dict[str: int]:
+    def fit_mini_batch(self, X: ndarray=None) -> ndarray:
+        '''
+            Fits the MiniBatchKMeans model over shuffled batches until the centroids settle and labels every Pokemon.
+
+            Args:
+            - X (ndarray): NumPy array of GXE scores, one row per Pokemon.
+
+            Returns:
+            ndarray: The cluster label of each Pokemon.
+        '''
+        rng = np.random.default_rng()
+        last_centers = None
+
+        for _ in range(self.max_iter):  # pass over shuffled batches until converged
+            order = rng.permutation(len(X))
+
+            for start in range(0, len(X), self.batch_size):  # update centroids per batch
+                self.model.partial_fit(X[order[start:start + self.batch_size]])
+
+            centers = self.model.cluster_centers_.copy()
+
+            if last_centers is not None and np.abs(centers - last_centers).max() < self.tol:
+                break
+
+            last_centers = centers
+
+        labels = np.empty(len(X), dtype=int)
+
+        for start in range(0, len(X), self.batch_size):  # then label per batch
+            labels[start:start + self.batch_size] = self.model.predict(X[start:start + self.batch_size])
+
+        return labels  # return labels in same order as X
+
+    def get_tiers(self, plotting: bool=False, previous_tiers: dict[str: int]=None, renderer: PlotRenderer=None) -> dict[str: int]:
         '''
             Assigns Pokemon to tiers and optionally plots the results.
 
             Args:
             - plotting (bool): If True, plots the Pokemon tiers.
+            - previous_tiers (dict[str: int]): Tiers from a previous run; if given, tier_changes is set to how many Pokemon changed tier.
+            - renderer (PlotRenderer): If given with plotting, renders the plot to a PNG in the background instead of showing it.
 
             Returns:
             dict[str: int]: A dictionary where keys are Pokemon names and values are their assigned tiers.
@@ -89,59 +165,98 @@ class PokemonTiers:
         pokemon_names = X[:, 0]  # e.g., 'mamoswine' per row
         X_pokemon_gxe = X[:, 1:].astype(float)  # e.g., 65, 73, 81 per row
 
-        self.model.fit(X_pokemon_gxe)
+        if self.mini_batch:
+            model_labels = self.fit_mini_batch(X_pokemon_gxe)
+        else:
+            self.model.fit(X_pokemon_gxe)
+            model_labels = self.model.labels_
 
         combined_avg_gxe = np.mean(X_pokemon_gxe, axis=1)
+        # per-label sums avoid a full mask per tier
+        label_sums = np.bincount(model_labels, weights=combined_avg_gxe, minlength=self.num_tiers)
+        label_counts = np.bincount(model_labels, minlength=self.num_tiers)
         tier_avg_gxe = {}  # for assigning combined average GXE to tiers
 
         for label in range(self.num_tiers):  # reorder tiers by average GXE
-            mask = (self.model.labels_ == label)
-            avg_gxe = np.mean(combined_avg_gxe[mask])
-            tier_avg_gxe[label] = avg_gxe
+            if label_counts[label] == 0:  # empty clusters keep their centroid order
+                tier_avg_gxe[label] = np.mean(self.model.cluster_centers_[label])
+            else:
+                tier_avg_gxe[label] = label_sums[label] / label_counts[label]
         
         sorted_tiers = sorted(tier_avg_gxe, key=tier_avg_gxe.get)
+        self.tier_centroids = self.model.cluster_centers_[sorted_tiers]  # tier 1 to tier N for warm starts
         name_tier_mapping = {}  # and assign PKMN labels to new tiers
 
-        if plotting:
-            fig = plt.figure(figsize=(7.25, 5.5))
-            ax = fig.add_subplot(111, projection='3d')
-            cmap = plt.cm.get_cmap('viridis', self.num_tiers)
-
         for label, tier in enumerate(sorted_tiers, start=1):
-            mask = (self.model.labels_ == tier)
+            mask = (model_labels == tier)
 
             for name in pokemon_names[mask]:  # assign PKMN to tier
                 name_tier_mapping[name] = label
-            
-            if plotting:  # and plot it with its centroid
-                ax.scatter(
-                    X_pokemon_gxe[mask, 0], X_pokemon_gxe[mask, 1], X_pokemon_gxe[mask, 2],
-                    label=f'pokémon of tier {label}', c=[cmap(label / (self.num_tiers + 1))]
-                )
-
-                centroid = self.model.cluster_centers_[tier]
-                ax.scatter(
-                    centroid[0], centroid[1], centroid[2], s=200, marker='o',
-                    label=f'centroid tier {label}', c=[cmap(label / (self.num_tiers + 1))], edgecolors='black'
-                )
-        
-        if plotting:
-            ax.set_xlabel('top player')
-            ax.set_ylabel('top 1% player')
-            ax.set_zlabel('top 5% player')
-            ax.set_title('Tiers of Pokémon\n(tier 1 is worst, tier N is best)')
 
-            handles, labels = ax.get_legend_handles_labels()
-            legend_elements = [(handle, label) for handle, label in zip(handles, labels)]
+        if plotting and renderer is not None:  # render to file off the critical path
+            renderer.submit('tiers', TIERS_PLOT_FILE, self.plot_tiers, X_pokemon_gxe, model_labels.copy(), sorted_tiers, self.model.cluster_centers_.copy())
+        elif plotting:
+            self.plot_tiers(X_pokemon_gxe, model_labels, sorted_tiers, self.model.cluster_centers_)
+
+        if previous_tiers is not None:  # count PKMN that moved tiers since last run
+            self.tier_changes = sum(1 for name, tier in name_tier_mapping.items() if name in previous_tiers and previous_tiers[name] != tier)
+
+        return name_tier_mapping  # return PKMN to tier
+
+    @staticmethod
+    def plot_tiers(X_pokemon_gxe: ndarray=None, model_labels: ndarray=None, sorted_tiers: list[int]=None, centroids: ndarray=None, file_path: str=None) -> None:
+        '''
+            Plots the Pokemon tiers with their centroids, either shown or saved to a file.
+
+            Args:
+            - X_pokemon_gxe (ndarray): NumPy array of GXE scores, one row per Pokemon.
+            - model_labels (ndarray): The cluster label of each Pokemon.
+            - sorted_tiers (list[int]): Cluster labels ordered from tier 1 to tier N.
+            - centroids (ndarray): The cluster centroids, indexed by cluster label.
+            - file_path (str): If given, saves the plot headlessly to this file instead of showing it.
+
+            Returns:
+            None
+        '''
+        num_tiers = len(sorted_tiers)
+
+        if file_path:  # pyplot-free figure is safe off the main thread
+            fig = Figure(figsize=(7.25, 5.5))
+        else:
+            fig = plt.figure(figsize=(7.25, 5.5))
+
+        ax = fig.add_subplot(111, projection='3d')
+        cmap = matplotlib.colormaps['viridis'].resampled(num_tiers)
+
+        for label, tier in enumerate(sorted_tiers, start=1):  # plot each tier with its centroid
+            mask = (model_labels == tier)
+            ax.scatter(
+                X_pokemon_gxe[mask, 0], X_pokemon_gxe[mask, 1], X_pokemon_gxe[mask, 2],
+                label=f'pokémon of tier {label}', c=[cmap(label / (num_tiers + 1))]
+            )
 
-            fig.legend(*zip(*legend_elements[::-1]), loc='upper right', bbox_to_anchor=(1, 1))
+            centroid = centroids[tier]
+            ax.scatter(
+                centroid[0], centroid[1], centroid[2], s=200, marker='o',
+                label=f'centroid tier {label}', c=[cmap(label / (num_tiers + 1))], edgecolors='black'
+            )
 
-            
+        ax.set_xlabel('top player')
+        ax.set_ylabel('top 1% player')
+        ax.set_zlabel('top 5% player')
+        ax.set_title('Tiers of Pokémon\n(tier 1 is worst, tier N is best)')
+
+        handles, labels = ax.get_legend_handles_labels()
+        legend_elements = [(handle, label) for handle, label in zip(handles, labels)]
+
+        fig.legend(*zip(*legend_elements[::-1]), loc='upper right', bbox_to_anchor=(1, 1))
+
+        if file_path:
+            fig.savefig(file_path)
+        else:
             plt.show()
             plt.close()
 
-        return name_tier_mapping  # return PKMN to tier
-
 
 if __name__ == '__main__':
     all_data = PokemonData(BASE_URL+TEST_MONTH_URL+TEST_FORMAT_URL)
@@ -7,9 +7,15 @@ TEST_FORMAT_URL = 'chaos/gen9vgc2023regulationebo3-1760.json'
 
 
 from pkmn_data import PokemonData
+from pkmn_rendering import PlotRenderer, GRAPH_PLOT_FILE
 from pkmn_tiering import PokemonTiers
 from pkmn_network import PokemonGraph
-from best_teammate import find_best_teammate
+from best_teammate import find_best_teammate, get_ranks_version, TeammateCache
+
+
+LOADED_DATA = {}  # month/format URL to (data, ranks, ranks fingerprint), reused across runs
+TEAMMATE_CACHE = TeammateCache()  # shared across runs, cleared when new data loads
+PLOT_RENDERER = PlotRenderer()  # renders plots to files while queries continue
 
 
 def print_intro() -> None:
@@ -21,30 +27,21 @@ def print_intro() -> None:
     '''
     print('WELCOME!!!\nThis application can tell you what the ~BEST~ Pokémon teammates are--simply follow the prompts (QUIT at any time by entering "quit"):\n')
 
-def find_teammate() -> bool:
+def load_data(ps_url: str=None, plotting: bool=False) -> tuple[PokemonData, dict[str: float], str]:
     '''
-        Handle user interaction for finding the best Pokemon teammate(s).
+        Load the Pokemon data for a month/format and rank its Pokemon.
+
+        Args:
+        - ps_url (str): The URL to the Smogon Showdown JSON data.
+        - plotting (bool): If True, renders the behind-the-scenes plots in the background.
 
         Returns:
-        bool: True if the user wants to find teammates again, False otherwise.
+        tuple[PokemonData, dict[str: float], str]: The loaded data, its PageRank scores and their fingerprint.
     '''
-    # handle display plots to user
-    plotting = input('Do you want to view the behind-the-scenes plots? (enter "yes" to enable or anything else to disable): ').lower().strip()
-    
-    if plotting == 'quit':
-        return False
-    elif plotting == 'yes':
-        plotting = True
-    else:
-        plotting = False
-    
-    # handle loading necessary objects and data
-    print('Loading Pokémon data...\n')
-
-    all_data = PokemonData(BASE_URL+TEST_MONTH_URL+TEST_FORMAT_URL)
+    all_data = PokemonData(ps_url)
     training_data = all_data.get_tiering_data()
     pkmn_tiers = PokemonTiers(training_data)
-    tiers = pkmn_tiers.get_tiers(plotting=plotting)
+    tiers = pkmn_tiers.get_tiers(plotting=plotting, renderer=PLOT_RENDERER)
     graph = PokemonGraph()
     edge_data = all_data.get_team_data()
     
@@ -52,10 +49,40 @@ def find_teammate() -> bool:
 
     pr = graph.get_pagerank(graph)
 
-    if plotting:
-        graph.viz_graph(graph)
+    if plotting:  # render headlessly in the background
+        PLOT_RENDERER.submit('graph', GRAPH_PLOT_FILE, graph.viz_graph, graph, open_browser=False)
+
+    return all_data, pr, get_ranks_version(pr)  # return everything queries need
+
+def find_teammate() -> bool:
+    '''
+        Handle user interaction for finding the best Pokemon teammate(s).
+
+        Returns:
+        bool: True if the user wants to find teammates again, False otherwise.
+    '''
+    ps_url = BASE_URL+TEST_MONTH_URL+TEST_FORMAT_URL
+
+    if ps_url not in LOADED_DATA:  # only load when the month/format changes
+        # handle display plots to user
+        plotting = input('Do you want to view the behind-the-scenes plots? (enter "yes" to enable or anything else to disable): ').lower().strip()
+        
+        if plotting == 'quit':
+            return False
+        elif plotting == 'yes':
+            plotting = True
+        else:
+            plotting = False
+        
+        # handle loading necessary objects and data
+        print('Loading Pokémon data...\n')
+
+        LOADED_DATA.clear()  # keep just the current month/format
+        LOADED_DATA[ps_url] = load_data(ps_url, plotting)
 
-    print('Pokémon data loaded!\n')
+        print('Pokémon data loaded!\n')
+
+    all_data, pr, ranks_version = LOADED_DATA[ps_url]
 
     # handle getting best teammate(s)
     pokemon = input('Would you like to start with a Pokémon? Enter a name if so, or leave this blank if you just want the best general teammates: ').lower().strip()
@@ -101,7 +128,7 @@ def find_teammate() -> bool:
     print('Now finding best teammate(s)...\n')
     
     # take all inputs and return results
-    find_best_teammate(ranks=pr, num_teammates=num_teammates, data=all_data, pokemon=pokemon, typing=typing, stat=stat, stat_value=value)
+    find_best_teammate(ranks=pr, num_teammates=num_teammates, data=all_data, pokemon=pokemon, typing=typing, stat=stat, stat_value=value, cache=TEAMMATE_CACHE, ranks_version=ranks_version)
 
     # handle if user wants to do this again
     run_again = input('\nWould you like to find teammates again? Enter "yes" if so, or anything else to quit: ').lower().strip()
@@ -132,5 +159,11 @@ if __name__ == '__main__':
 
     print_outro()
 
+    PLOT_RENDERER.shutdown()  # finish any plots still rendering
+
+    if PLOT_RENDERER.get_timing_report():
+        print('Plot rendering times:')
+        PLOT_RENDERER.print_timing_report()
+
     exit(0)
 